@@ -1,5 +1,6 @@
 from .enforcer import (
     enforce,
+    enforce_many,
     enforce_package_grant,
     enforce_translation_grant,
     enforce_with_routing,
@@ -62,6 +63,7 @@ __all__ = [
     "create_taj_token",
     "decode_token",
     "enforce",
+    "enforce_many",
     "enforce_package_grant",
     "enforce_translation_grant",
     "enforce_with_routing",
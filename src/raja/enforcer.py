@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+import functools
+import sys
+from collections.abc import Callable, Iterable, Sequence
 
 import structlog
 from pydantic import ValidationError
@@ -11,15 +13,15 @@ from .exceptions import (
     TokenInvalidError,
     TokenValidationError,
 )
-from .models import AuthRequest, Decision, PackageAccessRequest, Scope
+from .models import AuthRequest, Decision, PackageAccessRequest, Scope, Token
 from .package_map import PackageMap
 from .quilt_uri import package_name_matches
 from .scope import format_scope, parse_scope
 from .token import (
-    decode_token,
     validate_package_map_token,
     validate_package_token,
     validate_token,
+    verify_token,
 )
 
 
@@ -45,22 +47,30 @@ _MULTIPART_ACTIONS = {
     "s3:AbortMultipartUpload",
 }
 
+# (granted_action, requested_action) pairs where the granted action also allows the request.
+_ACTION_IMPLIES: frozenset[tuple[str, str]] = frozenset(
+    {("s3:GetObject", "s3:HeadObject")}
+    | {("s3:PutObject", action) for action in _MULTIPART_ACTIONS}
+)
+
+_IMPLIED_ACTIONS: dict[str, frozenset[str]] = {
+    granted: frozenset(requested for source, requested in _ACTION_IMPLIES if source == granted)
+    for granted, _ in _ACTION_IMPLIES
+}
+
 
 def _action_matches(granted_action: str, requested_action: str) -> bool:
-    if granted_action == requested_action:
-        return True
-    if requested_action == "s3:HeadObject" and granted_action == "s3:GetObject":
-        return True
-    if requested_action in _MULTIPART_ACTIONS and granted_action == "s3:PutObject":
-        return True
-    return False
+    return (
+        granted_action == requested_action or (granted_action, requested_action) in _ACTION_IMPLIES
+    )
 
 
 def is_prefix_match(granted_scope: str, requested_scope: str) -> bool:
     """Check if requested scope matches granted scope (key prefix matching only)."""
-    granted = parse_scope(granted_scope)
-    requested = parse_scope(requested_scope)
+    return _scope_matches(parse_scope(granted_scope), parse_scope(requested_scope))
 
+
+def _scope_matches(granted: Scope, requested: Scope) -> bool:
     if granted.resource_type != requested.resource_type:
         return False
     if not _action_matches(granted.action, requested.action):
@@ -99,12 +109,104 @@ def _package_action_allowed(mode: str, action: str) -> bool:
 logger = structlog.get_logger(__name__)
 
 
-def check_scopes(request: AuthRequest, granted_scopes: list[str]) -> bool:
+class ScopeMatcher:
+    """Index of a grant list for repeated scope checks against the same token.
+
+    Non-package grants are expanded by action implication at build time, so matching
+    is a set lookup for exact grants and one lookup per "/" in the requested key for
+    S3Object prefix grants. Package grants keep their wildcard name matching.
+
+    Grants are indexed in order up to the first malformed one, which is re-parsed
+    (and raises) when nothing ahead of it matches, as a linear scan would.
+
+    A matcher is immutable once built, so one instance can be shared by concurrent
+    checks against the same grant list.
+    """
+
+    def __init__(self, granted_scopes: Sequence[str]) -> None:
+        literals: set[tuple[str, str, str]] = set()
+        object_prefixes: dict[tuple[str, str], set[str]] = {}
+        packages: list[Scope] = []
+        self._invalid_scope: str | None = None
+
+        for granted_scope in granted_scopes:
+            try:
+                granted = parse_scope(granted_scope)
+            except Exception:
+                self._invalid_scope = granted_scope
+                break
+
+            if granted.resource_type == "Package":
+                packages.append(granted)
+                continue
+
+            # Resource types, actions and buckets repeat across grants; interning lets
+            # every index entry share one copy of each.
+            resource_type = sys.intern(granted.resource_type)
+            actions = {sys.intern(granted.action)} | _IMPLIED_ACTIONS.get(
+                granted.action, frozenset()
+            )
+            if resource_type == "S3Object":
+                if "/" not in granted.resource_id:
+                    continue
+                bucket, key = granted.resource_id.split("/", 1)
+                if key.endswith("/"):
+                    bucket = sys.intern(bucket)
+                    for action in actions:
+                        object_prefixes.setdefault((bucket, action), set()).add(key)
+                    continue
+            for action in actions:
+                literals.add((resource_type, granted.resource_id, action))
+
+        self._literals = frozenset(literals)
+        self._object_prefixes = {
+            bucket_action: frozenset(prefixes)
+            for bucket_action, prefixes in object_prefixes.items()
+        }
+        self._packages = tuple(packages)
+
+    def matches(self, requested: Scope) -> bool:
+        """Return True if any indexed grant covers the requested scope."""
+        if requested.resource_type == "Package":
+            if any(_scope_matches(granted, requested) for granted in self._packages):
+                return True
+        elif requested.resource_type == "S3Object":
+            if "/" in requested.resource_id and self._matches_object(requested):
+                return True
+        elif (requested.resource_type, requested.resource_id, requested.action) in self._literals:
+            return True
+
+        if self._invalid_scope is not None:
+            parse_scope(self._invalid_scope)
+        return False
+
+    def _matches_object(self, requested: Scope) -> bool:
+        if (requested.resource_type, requested.resource_id, requested.action) in self._literals:
+            return True
+        bucket, key = requested.resource_id.split("/", 1)
+        prefixes = self._object_prefixes.get((bucket, requested.action))
+        if not prefixes:
+            return False
+        position = key.find("/")
+        while position != -1:
+            if key[: position + 1] in prefixes:
+                return True
+            position = key.find("/", position + 1)
+        return False
+
+
+@functools.lru_cache(maxsize=2048)
+def _compile_granted_scopes(granted_scopes: tuple[str, ...]) -> ScopeMatcher:
+    return ScopeMatcher(granted_scopes)
+
+
+def check_scopes(request: AuthRequest, granted_scopes: list[str] | ScopeMatcher) -> bool:
     """Return True if the request scope is included in the granted scopes.
 
     Args:
         request: Authorization request containing resource and action
-        granted_scopes: List of scope strings granted to the principal
+        granted_scopes: List of scope strings granted to the principal, or a
+            ScopeMatcher built from them to reuse across requests
 
     Returns:
         True if the requested scope is a subset of granted scopes, False otherwise
@@ -127,14 +229,20 @@ def check_scopes(request: AuthRequest, granted_scopes: list[str]) -> bool:
         raise ScopeValidationError(f"unexpected error creating scope: {exc}") from exc
 
     try:
-        requested_scope_str = format_scope(
-            requested_scope.resource_type,
-            requested_scope.resource_id,
-            requested_scope.action,
-        )
-        return any(
-            is_prefix_match(granted_scope, requested_scope_str) for granted_scope in granted_scopes
-        )
+        if isinstance(granted_scopes, ScopeMatcher):
+            matcher = granted_scopes
+        elif not granted_scopes:
+            return False
+        else:
+            matcher = _compile_granted_scopes(tuple(granted_scopes))
+        # The fields are already validated above; only actions that the scope grammar
+        # rejects or reads differently need the full parse of the formatted scope.
+        action = requested_scope.action
+        if "\n" in action or action.count(":") > 1:
+            requested_scope = parse_scope(
+                format_scope(requested_scope.resource_type, requested_scope.resource_id, action)
+            )
+        return matcher.matches(requested_scope)
     except Exception as exc:
         logger.error("scope_subset_check_failed", error=str(exc), exc_info=True)
         raise ScopeValidationError(f"failed to check scope subset: {exc}") from exc
@@ -155,9 +263,42 @@ def enforce(token_str: str, request: AuthRequest, secret: str) -> Decision:
         This function follows a fail-closed design - any errors result in DENY.
         All exceptions are caught and logged with appropriate detail level.
     """
-    # Validate token
+    token = _validate_scope_token(token_str, secret)
+    if isinstance(token, Decision):
+        return token
+    return _enforce_scopes(token, request)
+
+
+def enforce_many(pairs: Iterable[tuple[str, AuthRequest]], secret: str) -> list[Decision]:
+    """Enforce a batch of (token, request) pairs, returning decisions in input order.
+
+    Each distinct token is validated once and its scopes are indexed once, so
+    authorizing many objects for the same principal costs one signature check.
+    Decision results are identical to calling enforce() on every pair, though an
+    invalid or expired token is logged once rather than once per pair.
+    """
+    validated: dict[str, tuple[Token, ScopeMatcher] | Decision] = {}
+    decisions: list[Decision] = []
+    for token_str, request in pairs:
+        entry = validated.get(token_str)
+        if entry is None:
+            token = _validate_scope_token(token_str, secret)
+            if isinstance(token, Decision):
+                entry = token
+            else:
+                entry = (token, _compile_granted_scopes(tuple(token.scopes)))
+            validated[token_str] = entry
+        if isinstance(entry, Decision):
+            decisions.append(entry.model_copy())
+        else:
+            token, matcher = entry
+            decisions.append(_enforce_scopes(token, request, matcher))
+    return decisions
+
+
+def _validate_scope_token(token_str: str, secret: str) -> Token | Decision:
     try:
-        token = validate_token(token_str, secret)
+        return validate_token(token_str, secret)
     except TokenExpiredError as exc:
         logger.warning("token_expired_in_enforce", error=str(exc))
         return Decision(allowed=False, reason="token expired")
@@ -171,9 +312,12 @@ def enforce(token_str: str, request: AuthRequest, secret: str) -> Decision:
         logger.error("unexpected_token_error_in_enforce", error=str(exc), exc_info=True)
         return Decision(allowed=False, reason="internal error during token validation")
 
-    # Check scopes
+
+def _enforce_scopes(
+    token: Token, request: AuthRequest, matcher: ScopeMatcher | None = None
+) -> Decision:
     try:
-        allowed = check_scopes(request, token.scopes)
+        allowed = check_scopes(request, token.scopes if matcher is None else matcher)
     except ScopeValidationError as exc:
         logger.warning("scope_validation_failed_in_enforce", error=str(exc))
         return Decision(allowed=False, reason="invalid request scope")
@@ -215,12 +359,23 @@ def enforce_with_routing(
     membership_checker: Callable[[str, str, str], bool] | None = None,
     manifest_resolver: Callable[[str], PackageMap] | None = None,
 ) -> Decision:
-    """Route enforcement based on token claim structure."""
+    """Route enforcement based on token claim structure.
+
+    Claims are read from the verified payload, so the selected enforcer's own
+    validation is served from the verified-token cache rather than re-checking
+    the signature.
+    """
     try:
-        payload = decode_token(token_str)
+        payload = verify_token(token_str, secret)
+    except TokenExpiredError as exc:
+        logger.warning("token_expired_in_routing", error=str(exc))
+        return Decision(allowed=False, reason="token expired")
     except TokenInvalidError as exc:
-        logger.warning("token_decode_failed_in_enforce", error=str(exc))
+        logger.warning("token_invalid_in_routing", error=str(exc))
         return Decision(allowed=False, reason="invalid token")
+    except TokenValidationError as exc:
+        logger.warning("token_validation_failed_in_routing", error=str(exc))
+        return Decision(allowed=False, reason=str(exc))
     except Exception as exc:
         logger.error("unexpected_token_decode_error", error=str(exc), exc_info=True)
         return Decision(allowed=False, reason="internal error during token routing")
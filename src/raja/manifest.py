@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import os
 import tempfile
 from collections.abc import Iterable
@@ -40,35 +41,54 @@ def _iter_locations(entries: Iterable[tuple[str, object]]) -> list[tuple[str, S3
 
 def resolve_package_manifest(quilt_uri: str) -> list[S3Location]:
     """Resolve a Quilt+ URI to a list of physical S3 locations."""
-    parsed = parse_quilt_uri(quilt_uri)
-    quilt3 = _load_quilt3()
-    package = quilt3.Package.browse(
-        name=parsed.package_name,
-        registry=f"{parsed.storage}://{parsed.registry}",
-        top_hash=parsed.hash,
-    )
-    locations = _iter_locations(package.walk())
-    return [location for _, location in locations]
+    package_map = resolve_package_map(quilt_uri)
+    return [location for targets in package_map.entries.values() for location in targets]
 
 
 def resolve_package_map(quilt_uri: str) -> PackageMap:
-    """Resolve a Quilt+ URI to a logical-to-physical package map."""
+    """Resolve a Quilt+ URI to a logical-to-physical package map.
+
+    Quilt+ URIs pin a top hash, so a package's contents never change and the
+    resolved map is cached per pinned package, regardless of any ``path`` in the
+    URI. The map and its locations are frozen, so sharing it is safe.
+    """
     parsed = parse_quilt_uri(quilt_uri)
+    return _resolve_package_map(parsed.storage, parsed.registry, parsed.package_name, parsed.hash)
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_package_map(
+    storage: str, registry: str, package_name: str, top_hash: str
+) -> PackageMap:
     quilt3 = _load_quilt3()
     package = quilt3.Package.browse(
-        name=parsed.package_name,
-        registry=f"{parsed.storage}://{parsed.registry}",
-        top_hash=parsed.hash,
+        name=package_name,
+        registry=f"{storage}://{registry}",
+        top_hash=top_hash,
     )
     mapping: dict[str, list[S3Location]] = {}
     for logical_path, location in _iter_locations(package.walk()):
         mapping.setdefault(logical_path, []).append(location)
-    return PackageMap(entries=mapping)
+    return PackageMap(entries={path: tuple(targets) for path, targets in mapping.items()})
+
+
+@functools.lru_cache(maxsize=256)
+def _physical_locations(
+    storage: str, registry: str, package_name: str, top_hash: str
+) -> frozenset[tuple[str, str]]:
+    return _resolve_package_map(storage, registry, package_name, top_hash).physical_locations()
+
+
+def clear_package_map_cache() -> None:
+    """Drop all cached package maps and their physical location sets."""
+    _physical_locations.cache_clear()
+    _resolve_package_map.cache_clear()
 
 
 def package_membership_checker(quilt_uri: str, bucket: str, key: str) -> bool:
     """Return True if the bucket/key is a member of the Quilt package."""
-    for location in resolve_package_manifest(quilt_uri):
-        if location.bucket == bucket and location.key == key:
-            return True
-    return False
+    parsed = parse_quilt_uri(quilt_uri)
+    locations = _physical_locations(
+        parsed.storage, parsed.registry, parsed.package_name, parsed.hash
+    )
+    return (bucket, key) in locations
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Any, Literal
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ConfigDict, field_validator
 
 
 class ResourceValidatorMixin(BaseModel):
@@ -56,12 +56,16 @@ class ResourceValidatorMixin(BaseModel):
 
 
 class Scope(ResourceValidatorMixin):
+    model_config = ConfigDict(frozen=True)
+
     resource_type: str
     resource_id: str
     action: str
 
 
 class AuthRequest(ResourceValidatorMixin):
+    model_config = ConfigDict(frozen=True)
+
     resource_type: str
     resource_id: str
     action: str
@@ -69,6 +73,8 @@ class AuthRequest(ResourceValidatorMixin):
 
 
 class PackageAccessRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     bucket: str
     key: str
     action: str
@@ -82,6 +88,8 @@ class PackageAccessRequest(BaseModel):
 
 
 class S3Location(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     bucket: str
     key: str
 
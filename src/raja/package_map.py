@@ -1,22 +1,39 @@
 from __future__ import annotations
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ConfigDict, field_validator
 
 from .models import S3Location
 
 
 class PackageMap(BaseModel):
-    entries: dict[str, list[S3Location]]
+    # Resolved maps are cached and shared across requests, so targets are stored as
+    # tuples of frozen locations and translate() hands out a fresh list.
+    model_config = ConfigDict(frozen=True)
+
+    entries: dict[str, tuple[S3Location, ...]]
 
     @field_validator("entries")
     @classmethod
-    def _entries_non_null(cls, value: dict[str, list[S3Location]]) -> dict[str, list[S3Location]]:
+    def _entries_non_null(
+        cls, value: dict[str, tuple[S3Location, ...]]
+    ) -> dict[str, tuple[S3Location, ...]]:
         return value or {}
 
     def translate(self, logical_key: str) -> list[S3Location]:
         if not logical_key or logical_key.strip() == "":
             raise ValueError("logical key must be non-empty")
-        return self.entries.get(logical_key, [])
+        return list(self.entries.get(logical_key, ()))
+
+    def physical_locations(self) -> frozenset[tuple[str, str]]:
+        """All (bucket, key) pairs the map points at, for constant-time membership checks."""
+        return frozenset(
+            (location.bucket, location.key)
+            for targets in self.entries.values()
+            for location in targets
+        )
+
+    def contains(self, bucket: str, key: str) -> bool:
+        return (bucket, key) in self.physical_locations()
 
 
 def parse_s3_path(value: str) -> tuple[str, str]:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import fnmatch
+import functools
 from dataclasses import dataclass
 from urllib.parse import parse_qs, urlsplit
 
@@ -31,11 +32,20 @@ def _parse_package_value(value: str) -> tuple[str, str]:
     return package_name, package_hash
 
 
-def parse_quilt_uri(uri: str) -> QuiltUri:
-    """Parse and validate a Quilt+ URI string."""
+def _require_uri_string(uri: str) -> None:
     if not uri or not isinstance(uri, str):
         raise ValueError("quilt uri must be a non-empty string")
 
+
+def parse_quilt_uri(uri: str) -> QuiltUri:
+    """Parse and validate a Quilt+ URI string."""
+    _require_uri_string(uri)
+    return _parse_quilt_uri(uri)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_quilt_uri(uri: str) -> QuiltUri:
+    # QuiltUri is frozen, so one parse can be shared by every caller of the same URI.
     split = urlsplit(uri)
     scheme = split.scheme
     if not scheme or not scheme.lower().startswith("quilt+"):
@@ -79,8 +89,13 @@ def parse_quilt_uri(uri: str) -> QuiltUri:
 
 def normalize_quilt_uri(uri: str) -> str:
     """Return a canonical Quilt+ URI with normalized scheme and path separators."""
-    parsed = parse_quilt_uri(uri)
-    return parsed.normalized()
+    _require_uri_string(uri)
+    return _normalize_quilt_uri(uri)
+
+
+@functools.lru_cache(maxsize=1024)
+def _normalize_quilt_uri(uri: str) -> str:
+    return _parse_quilt_uri(uri).normalized()
 
 
 def validate_quilt_uri(uri: str) -> str:
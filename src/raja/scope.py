@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import functools
 import re
-from collections.abc import Iterable, Sequence
+from collections.abc import Callable, Iterable, Sequence
 
 import structlog
 from pydantic import ValidationError
@@ -11,12 +12,13 @@ from .models import Scope
 
 logger = structlog.get_logger(__name__)
 
-_SCOPE_PATTERN = re.compile(r"^(?P<resource_type>[^:]+):(?P<resource_id>[^:]+):(?P<action>.+)$")
-
 
+@functools.lru_cache(maxsize=8192)
 def parse_scope(scope_str: str) -> Scope:
     """Parse a scope string into a Scope model.
 
+    Results are cached; Scope is frozen, so callers share the parsed instance.
+
     Args:
         scope_str: Scope string in format "ResourceType:ResourceId:Action"
 
@@ -27,20 +29,23 @@ def parse_scope(scope_str: str) -> Scope:
         ScopeParseError: If the scope string doesn't match expected format
         ScopeValidationError: If the parsed scope fails validation
     """
-    match = _SCOPE_PATTERN.match(scope_str)
-    if not match:
+    resource_type, _, rest = scope_str.partition(":")
+    resource_id, separator, action = rest.partition(":")
+    if action.endswith("\n"):
+        # A single trailing newline has always been tolerated and dropped.
+        action = action[:-1]
+    if not resource_type or not resource_id or not separator or not action or "\n" in action:
         logger.warning("scope_parse_failed", scope=scope_str)
         raise ScopeParseError(
             f"scope must match 'ResourceType:ResourceId:Action', got: {scope_str}"
         )
 
-    action = match.group("action")
     if action.count(":") > 1:
         logger.warning("scope_parse_failed_extra_colons", scope=scope_str)
         raise ScopeParseError("scope contains invalid colons in resource_id or action")
 
     try:
-        return Scope(**match.groupdict())
+        return Scope(resource_type=resource_type, resource_id=resource_id, action=action)
     except ValidationError as exc:
         logger.warning("scope_validation_failed", scope=scope_str, error=str(exc))
         raise ScopeValidationError(f"invalid scope data: {exc}") from exc
@@ -118,15 +123,59 @@ def matches_pattern(value: str, pattern: str) -> bool:
         >>> matches_pattern("s3:GetObject", "ec2:*")
         False
     """
+    return _compile_pattern(pattern)(value)
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_pattern(pattern: str) -> Callable[[str], bool]:
+    """Classify a wildcard pattern once and return a matcher for its shape.
+
+    A lone "*" matches anything. Elsewhere "*" does not span newlines, as in the
+    regex translation used for general patterns.
+    """
     if pattern == "*":
-        return True
+        return lambda value: True
 
     if "*" not in pattern:
-        return value == pattern
+        return lambda value: value == pattern
+
+    if pattern.count("*") == 1:
+        head, _, tail = pattern.partition("*")
+        if not tail:
+            return lambda value: value.startswith(head) and value.find("\n", len(head)) == -1
+        if not head:
+            return lambda value: (
+                value.endswith(tail) and value.find("\n", 0, len(value) - len(tail)) == -1
+            )
+
+    if "\n" in pattern:
+        regex = re.compile(re.escape(pattern).replace(r"\*", ".*"))
+        return lambda value: regex.fullmatch(value) is not None
+
+    return functools.partial(_match_fixwords, tuple(pattern.split("*")))
+
+
+def _match_fixwords(fixwords: tuple[str, ...], value: str) -> bool:
+    """Match a value against the literal pieces of a multi-wildcard pattern.
 
-    # Convert wildcard pattern to regex
-    regex_pattern = re.escape(pattern).replace(r"\*", ".*")
-    return bool(re.fullmatch(regex_pattern, value))
+    The first and last pieces are anchored; each middle piece is found with a forward
+    search from the end of the previous one, so matching never backtracks. The
+    pattern has no newlines and "*" cannot span one, so a value containing a newline
+    cannot match.
+    """
+    if "\n" in value:
+        return False
+    head, *middle, tail = fixwords
+    end = len(value) - len(tail)
+    if end < len(head) or not value.startswith(head) or not value.endswith(tail):
+        return False
+    position = len(head)
+    for fixword in middle:
+        position = value.find(fixword, position, end)
+        if position == -1:
+            return False
+        position += len(fixword)
+    return True
 
 
 def scope_matches(requested: Scope, granted: Scope) -> bool:
@@ -217,6 +266,9 @@ def expand_wildcard_scope(
     return [scope_pattern]
 
 
+_ScopeMatchers = tuple[Callable[[str], bool], Callable[[str], bool], Callable[[str], bool]]
+
+
 def filter_scopes_by_pattern(
     scopes: Sequence[str],
     include_patterns: list[str] | None = None,
@@ -242,16 +294,16 @@ def filter_scopes_by_pattern(
         ["S3Bucket:a:read", "S3Bucket:b:read"]
     """
     filtered = list(scopes)
+    # Each distinct pattern is compiled into its three component matchers on first use,
+    # so an invalid pattern still only raises if the filter reaches it.
+    compiled: dict[str, _ScopeMatchers] = {}
 
     # Apply inclusion patterns
     if include_patterns:
         filtered = [
             scope_str
             for scope_str in filtered
-            if any(
-                scope_matches(parse_scope(scope_str), parse_scope(pattern))
-                for pattern in include_patterns
-            )
+            if _matches_any_pattern(scope_str, include_patterns, compiled)
         ]
 
     # Apply exclusion patterns
@@ -259,10 +311,35 @@ def filter_scopes_by_pattern(
         filtered = [
             scope_str
             for scope_str in filtered
-            if not any(
-                scope_matches(parse_scope(scope_str), parse_scope(pattern))
-                for pattern in exclude_patterns
-            )
+            if not _matches_any_pattern(scope_str, exclude_patterns, compiled)
         ]
 
     return filtered
+
+
+def _compile_scope_pattern(pattern: str) -> _ScopeMatchers:
+    granted = parse_scope(pattern)
+    return (
+        _compile_pattern(granted.resource_type),
+        _compile_pattern(granted.resource_id),
+        _compile_pattern(granted.action),
+    )
+
+
+def _matches_any_pattern(
+    scope_str: str,
+    patterns: list[str],
+    compiled: dict[str, _ScopeMatchers],
+) -> bool:
+    scope = parse_scope(scope_str)
+    for pattern in patterns:
+        if pattern not in compiled:
+            compiled[pattern] = _compile_scope_pattern(pattern)
+        match_type, match_id, match_action = compiled[pattern]
+        if (
+            match_type(scope.resource_type)
+            and match_id(scope.resource_id)
+            and match_action(scope.action)
+        ):
+            return True
+    return False
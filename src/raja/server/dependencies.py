@@ -7,6 +7,7 @@ reused across invocations.
 
 from __future__ import annotations
 
+import functools
 import os
 import secrets
 from typing import Any
@@ -14,10 +15,6 @@ from typing import Any
 import boto3
 from fastapi import HTTPException, Request
 
-# Module-level caches (initialized once per Lambda container)
-_datazone_client: Any | None = None
-_jwt_secret_cache: dict[str, str] | None = None
-
 
 def _get_region() -> str:
     region = os.environ.get("AWS_REGION") or os.environ.get("AWS_DEFAULT_REGION")
@@ -32,24 +29,14 @@ def _require_env(value: str | None, name: str) -> str:
     return value
 
 
+@functools.lru_cache(maxsize=1)
 def get_datazone_client() -> Any:
     """Get cached Amazon DataZone client."""
-    global _datazone_client
-    if _datazone_client is None:
-        _datazone_client = boto3.client("datazone", region_name=_get_region())
-    return _datazone_client
-
+    return boto3.client("datazone", region_name=_get_region())
 
-def get_jwt_secret() -> str:
-    """Get JWT signing secret from AWS Secrets Manager."""
-    global _jwt_secret_cache
-
-    secret_arn = _require_env(os.environ.get("JWT_SECRET_ARN"), "JWT_SECRET_ARN")
-    secret_version = os.environ.get("JWT_SECRET_VERSION")
-    cache_key = f"{secret_arn}:{secret_version or ''}"
-    if _jwt_secret_cache is not None and cache_key in _jwt_secret_cache:
-        return _jwt_secret_cache[cache_key]
 
+@functools.lru_cache(maxsize=8)
+def _load_jwt_secret(secret_arn: str, secret_version: str | None) -> str:
     client = boto3.client("secretsmanager", region_name=_get_region())
     get_secret_kwargs: dict[str, str] = {"SecretId": secret_arn}
     if secret_version:
@@ -58,12 +45,22 @@ def get_jwt_secret() -> str:
     secret = response.get("SecretString")
     if not isinstance(secret, str) or not secret:
         raise RuntimeError("Secrets Manager returned an invalid SecretString")
-    if _jwt_secret_cache is None:
-        _jwt_secret_cache = {}
-    _jwt_secret_cache[cache_key] = secret
     return secret
 
 
+def get_jwt_secret() -> str:
+    """Get JWT signing secret from AWS Secrets Manager."""
+    secret_arn = _require_env(os.environ.get("JWT_SECRET_ARN"), "JWT_SECRET_ARN")
+    secret_version = os.environ.get("JWT_SECRET_VERSION") or None
+    return _load_jwt_secret(secret_arn, secret_version)
+
+
+def clear_caches() -> None:
+    """Drop cached AWS clients and secrets."""
+    get_datazone_client.cache_clear()
+    _load_jwt_secret.cache_clear()
+
+
 def require_admin_auth(request: Request) -> None:
     """Require a valid admin bearer token in the Authorization header."""
     auth_header = request.headers.get("Authorization")
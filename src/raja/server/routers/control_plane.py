@@ -3,11 +3,15 @@
 from __future__ import annotations
 
 import base64
+import copy
+import functools
 import os
 import re
 import secrets
+import threading
 import time
 import uuid
+from collections import OrderedDict
 from typing import Any
 from urllib.parse import quote
 
@@ -119,6 +123,14 @@ class RaleDeliverRequest(BaseModel):
 
 DATAZONE_DOMAIN_ID = os.environ.get("DATAZONE_DOMAIN_ID")
 TOKEN_TTL = int(os.environ.get("TOKEN_TTL", "3600"))
+PRINCIPALS_CACHE_TTL = float(os.environ.get("PRINCIPALS_CACHE_TTL", "5"))
+
+# list_principals responses keyed by limit. Every miss walks each project's membership
+# through DataZone, and the admin UI polls this in bursts. limit is client-supplied, so
+# the cache is bounded and expired entries are dropped on every write.
+_PRINCIPALS_CACHE_SIZE = 8
+_principals_cache: OrderedDict[int | None, tuple[float, dict[str, Any]]] = OrderedDict()
+_principals_cache_lock = threading.Lock()
 
 
 def _require_env(value: str | None, name: str) -> str:
@@ -139,6 +151,11 @@ def _now() -> int:
     return int(time.time())
 
 
+def _clear_principals_cache() -> None:
+    with _principals_cache_lock:
+        _principals_cache.clear()
+
+
 def _authorization_plane_id() -> str:
     return f"datazone:{_require_env(DATAZONE_DOMAIN_ID, 'DATAZONE_DOMAIN_ID')}"
 
@@ -925,6 +942,12 @@ def list_principals(
     datazone: Any = Depends(dependencies.get_datazone_client),
 ) -> dict[str, Any]:
     logger.debug("principals_list_requested", limit=limit)
+    now = time.monotonic()
+    with _principals_cache_lock:
+        cached = _principals_cache.get(limit)
+    if cached is not None and now - cached[0] < PRINCIPALS_CACHE_TTL:
+        return copy.deepcopy(cached[1])
+
     try:
         config = DataZoneConfig.from_env()
         service = _datazone_service(datazone)
@@ -947,10 +970,22 @@ def list_principals(
     except DataZoneError as exc:
         raise HTTPException(status_code=503, detail=str(exc)) from exc
     logger.info("principals_listed", count=len(principals))
-    return {
+    response = {
         "principals": principals,
         "principal_summary": _summarize_principals(principals),
     }
+    with _principals_cache_lock:
+        for key in [
+            key
+            for key, (stored_at, _) in _principals_cache.items()
+            if now - stored_at >= PRINCIPALS_CACHE_TTL
+        ]:
+            del _principals_cache[key]
+        _principals_cache[limit] = (now, response)
+        _principals_cache.move_to_end(limit)
+        while len(_principals_cache) > _PRINCIPALS_CACHE_SIZE:
+            _principals_cache.popitem(last=False)
+    return copy.deepcopy(response)
 
 
 @router.get("/admin/structure")
@@ -1469,6 +1504,7 @@ def add_principal_to_project(
     except DataZoneError as exc:
         raise HTTPException(status_code=503, detail=str(exc)) from exc
 
+    _clear_principals_cache()
     logger.info("principal_created", principal=principal)
     return {
         "principal": principal,
@@ -1494,6 +1530,7 @@ def remove_principal_from_project(
         service.delete_project_membership(project_id=project_id, user_identifier=principal)
     except DataZoneError as exc:
         raise HTTPException(status_code=503, detail=str(exc)) from exc
+    _clear_principals_cache()
     logger.info("principal_deleted", principal=principal)
     return {"message": f"Removed {principal} from project"}
 
@@ -1588,9 +1625,9 @@ def delete_policy(
     )
 
 
-@router.get("/.well-known/jwks.json")
-def get_jwks(secret: str = Depends(dependencies.get_jwt_secret)) -> dict[str, Any]:
-    """Return JWKS for JWT signature verification."""
+@functools.lru_cache(maxsize=4)
+def _build_jwks(secret: str) -> dict[str, Any]:
+    """Build the JWKS document for a signing secret (cached; callers must not mutate it)."""
     key_bytes = secret.encode("utf-8")
     k_value = base64.urlsafe_b64encode(key_bytes).decode("utf-8").rstrip("=")
     return {
@@ -1603,3 +1640,9 @@ def get_jwks(secret: str = Depends(dependencies.get_jwt_secret)) -> dict[str, An
             }
         ]
     }
+
+
+@router.get("/.well-known/jwks.json")
+def get_jwks(secret: str = Depends(dependencies.get_jwt_secret)) -> dict[str, Any]:
+    """Return JWKS for JWT signature verification."""
+    return _build_jwks(secret)
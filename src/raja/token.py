@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import copy
+import hashlib
+import threading
 import time
+from collections import OrderedDict
 from typing import Any
 
 import jwt
@@ -13,6 +17,55 @@ from .quilt_uri import validate_quilt_uri
 
 logger = structlog.get_logger(__name__)
 
+# Verified payloads keyed by a digest of (secret, token). Bearer tokens are replayed on
+# every request within their TTL, so this skips repeat HMAC verification and JSON parsing.
+_VERIFIED_PAYLOAD_CACHE_SIZE = 10_000
+_verified_payload_cache: OrderedDict[bytes, dict[str, Any]] = OrderedDict()
+_verified_payload_cache_lock = threading.Lock()
+
+
+def _verified_payload_cache_key(token_str: str, secret: str) -> bytes:
+    """Digest a (secret, token) pair so neither is retained in the cache."""
+    digest = hashlib.blake2b(digest_size=32)
+    digest.update(secret.encode("utf-8"))
+    # Tokens never contain NUL, so this separator keeps the encoding unambiguous.
+    digest.update(b"\x00")
+    digest.update(token_str.encode("utf-8"))
+    return digest.digest()
+
+
+def _decode_verified(token_str: str, secret: str) -> dict[str, Any]:
+    """Verify an HS256 JWT and return its payload, reusing earlier verifications.
+
+    Only payloads that passed ``jwt.decode`` are cached, and a cached payload is
+    served only while its ``exp`` claim is in the future; otherwise the token is
+    decoded again so PyJWT raises the appropriate error. The returned dict is the
+    cached entry itself, so internal callers only read it; verify_token hands out copies.
+    """
+    key = _verified_payload_cache_key(token_str, secret)
+    with _verified_payload_cache_lock:
+        cached = _verified_payload_cache.get(key)
+        if cached is not None:
+            _verified_payload_cache.move_to_end(key)
+    if cached is not None:
+        expires_at = cached.get("exp")
+        if expires_at is None or expires_at > time.time():
+            return cached
+
+    payload: dict[str, Any] = jwt.decode(token_str, secret, algorithms=["HS256"])
+    with _verified_payload_cache_lock:
+        _verified_payload_cache[key] = payload
+        _verified_payload_cache.move_to_end(key)
+        if len(_verified_payload_cache) > _VERIFIED_PAYLOAD_CACHE_SIZE:
+            _verified_payload_cache.popitem(last=False)
+    return payload
+
+
+def clear_verified_token_cache() -> None:
+    """Drop all cached token verifications."""
+    with _verified_payload_cache_lock:
+        _verified_payload_cache.clear()
+
 
 def create_token(
     subject: str,
@@ -160,7 +213,7 @@ def create_taj_token(
 def validate_package_token(token_str: str, secret: str) -> PackageToken:
     """Validate a JWT signature and return a decoded PackageToken model."""
     try:
-        payload = jwt.decode(token_str, secret, algorithms=["HS256"])
+        payload = _decode_verified(token_str, secret)
     except jwt.ExpiredSignatureError as exc:
         logger.warning("package_token_expired", error=str(exc))
         raise TokenExpiredError("token expired") from exc
@@ -204,7 +257,7 @@ def validate_package_token(token_str: str, secret: str) -> PackageToken:
 def validate_package_map_token(token_str: str, secret: str) -> PackageMapToken:
     """Validate a JWT signature and return a decoded PackageMapToken model."""
     try:
-        payload = jwt.decode(token_str, secret, algorithms=["HS256"])
+        payload = _decode_verified(token_str, secret)
     except jwt.ExpiredSignatureError as exc:
         logger.warning("package_map_token_expired", error=str(exc))
         raise TokenExpiredError("token expired") from exc
@@ -270,7 +323,7 @@ def validate_package_map_token(token_str: str, secret: str) -> PackageMapToken:
 def validate_taj_token(token_str: str, secret: str) -> TajToken:
     """Validate a JWT signature and return a decoded TajToken model."""
     try:
-        payload = jwt.decode(token_str, secret, algorithms=["HS256"])
+        payload = _decode_verified(token_str, secret)
     except jwt.ExpiredSignatureError as exc:
         logger.warning("taj_token_expired", error=str(exc))
         raise TokenExpiredError("token expired") from exc
@@ -334,7 +387,7 @@ def validate_token(token_str: str, secret: str) -> Token:
         TokenValidationError: If token validation fails for other reasons
     """
     try:
-        payload = jwt.decode(token_str, secret, algorithms=["HS256"])
+        payload = _decode_verified(token_str, secret)
     except jwt.ExpiredSignatureError as exc:
         logger.warning("token_expired", error=str(exc))
         raise TokenExpiredError("token expired") from exc
@@ -367,6 +420,36 @@ def validate_token(token_str: str, secret: str) -> Token:
         raise TokenValidationError(f"failed to create token model: {exc}") from exc
 
 
+def verify_token(token_str: str, secret: str) -> dict[str, Any]:
+    """Validate a JWT signature and expiration and return its raw payload.
+
+    Args:
+        token_str: JWT token string to validate
+        secret: Secret key used to verify the token signature
+
+    Returns:
+        Dictionary containing the verified JWT payload
+
+    Raises:
+        TokenExpiredError: If the token has expired
+        TokenInvalidError: If the token is malformed or signature is invalid
+        TokenValidationError: If token validation fails for other reasons
+    """
+    try:
+        # Public callers get a deep copy: foreign tokens may carry nested claims, and
+        # none of them may reach back into the verified-payload cache.
+        return copy.deepcopy(_decode_verified(token_str, secret))
+    except jwt.ExpiredSignatureError as exc:
+        logger.warning("token_expired", error=str(exc))
+        raise TokenExpiredError("token expired") from exc
+    except jwt.InvalidTokenError as exc:
+        logger.warning("token_invalid", error=str(exc))
+        raise TokenInvalidError("invalid token") from exc
+    except Exception as exc:
+        logger.error("unexpected_token_validation_error", error=str(exc), exc_info=True)
+        raise TokenValidationError(f"unexpected token validation error: {exc}") from exc
+
+
 def decode_token(token_str: str) -> dict[str, Any]:
     """Decode a JWT without validating signature or expiration.
 
@@ -379,6 +462,11 @@ def decode_token(token_str: str) -> dict[str, Any]:
     Raises:
         TokenInvalidError: If the token cannot be decoded
     """
+    # A compact JWS has exactly three segments; reject anything else before PyJWT
+    # starts splitting and base64-decoding it.
+    if isinstance(token_str, str) and token_str.count(".") != 2:
+        logger.warning("token_decode_failed", error="malformed token")
+        raise TokenInvalidError("failed to decode token: expected three dot-separated segments")
     try:
         payload = jwt.decode(
             token_str,
@@ -6,7 +6,11 @@ from unittest.mock import patch
 
 import pytest
 
+from raja import enforcer, quilt_uri, scope
+from raja.manifest import clear_package_map_cache
+from raja.server import dependencies
 from raja.server.routers import control_plane
+from raja.token import clear_verified_token_cache
 
 
 @pytest.fixture(autouse=True)
@@ -14,3 +18,24 @@ def patch_datazone_domain_id() -> None:
     """Ensure DATAZONE_DOMAIN_ID is set for all unit tests that hit _policy_plane_id()."""
     with patch.object(control_plane, "DATAZONE_DOMAIN_ID", "dzd_unit_test"):
         yield
+
+
+def _clear_module_caches() -> None:
+    control_plane._clear_principals_cache()
+    control_plane._build_jwks.cache_clear()
+    dependencies.clear_caches()
+    clear_verified_token_cache()
+    clear_package_map_cache()
+    scope.parse_scope.cache_clear()
+    scope._compile_pattern.cache_clear()
+    quilt_uri._parse_quilt_uri.cache_clear()
+    quilt_uri._normalize_quilt_uri.cache_clear()
+    enforcer._compile_granted_scopes.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_caches() -> None:
+    """Keep every module-level cache from leaking state between tests."""
+    _clear_module_caches()
+    yield
+    _clear_module_caches()
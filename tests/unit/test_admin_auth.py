@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import importlib
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -9,11 +8,7 @@ from fastapi.testclient import TestClient
 from starlette.requests import Request
 
 from raja.datazone import DataZoneConfig, ProjectConfig
-
-server_app = importlib.import_module("raja.server.app")
-dependencies = importlib.import_module("raja.server.dependencies")
-
-app = server_app.app
+from raja.server import app, dependencies
 
 
 def _request_with_headers(headers: list[tuple[bytes, bytes]]) -> Request:
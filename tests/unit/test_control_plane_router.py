@@ -233,6 +233,65 @@ def test_list_principals_without_limit():
     ]
 
 
+def test_list_principals_reuses_recent_response():
+    datazone = MagicMock()
+    with patch.object(control_plane, "_datazone_service") as factory:
+        with patch.object(control_plane, "DataZoneConfig") as mock_config_cls:
+            mock_config_cls.from_env.return_value = _config(
+                include_second=False,
+                include_third=False,
+            )
+            service = factory.return_value
+            service.list_project_members.return_value = ["alice"]
+            first = control_plane.list_principals(limit=None, datazone=datazone)
+            second = control_plane.list_principals(limit=None, datazone=datazone)
+            control_plane.list_principals(limit=1, datazone=datazone)
+
+    assert second == first
+    assert service.list_project_members.call_count == 2
+
+
+def test_list_principals_cache_returns_copies_and_stays_bounded():
+    datazone = MagicMock()
+    with patch.object(control_plane, "_datazone_service") as factory:
+        with patch.object(control_plane, "DataZoneConfig") as mock_config_cls:
+            mock_config_cls.from_env.return_value = _config(
+                include_second=False,
+                include_third=False,
+            )
+            service = factory.return_value
+            service.list_project_members.return_value = ["alice"]
+            first = control_plane.list_principals(limit=None, datazone=datazone)
+            first["principals"].clear()
+            second = control_plane.list_principals(limit=None, datazone=datazone)
+            for limit in range(1, 50):
+                control_plane.list_principals(limit=limit, datazone=datazone)
+
+    assert [p["principal"] for p in second["principals"]] == ["alice"]
+    assert len(control_plane._principals_cache) == control_plane._PRINCIPALS_CACHE_SIZE
+
+
+def test_principal_membership_changes_invalidate_list_cache():
+    datazone = MagicMock()
+    with patch.object(control_plane, "_datazone_service") as factory:
+        with patch.object(control_plane, "DataZoneConfig") as mock_config_cls:
+            mock_config_cls.from_env.return_value = _config(
+                include_second=False,
+                include_third=False,
+            )
+            service = factory.return_value
+            service.list_project_members.side_effect = [["alice"], ["alice", "bob"], ["alice"]]
+            control_plane.list_principals(limit=None, datazone=datazone)
+            with patch.object(control_plane, "datazone_enabled", return_value=True):
+                control_plane.add_principal_to_project("bob", "proj-alpha", datazone=datazone)
+            added = control_plane.list_principals(limit=None, datazone=datazone)
+            control_plane.remove_principal_from_project("bob", "proj-alpha", datazone=datazone)
+            removed = control_plane.list_principals(limit=None, datazone=datazone)
+
+    assert [p["principal"] for p in added["principals"]] == ["alice", "bob"]
+    assert [p["principal"] for p in removed["principals"]] == ["alice"]
+
+
 def test_list_principals_preserves_multi_project_memberships():
     """A principal in two projects should remain visible in both rows."""
     datazone = MagicMock()
@@ -655,6 +714,12 @@ def test_get_jwks():
     assert "k" in key
 
 
+def test_get_jwks_reuses_document_per_secret():
+    first = control_plane.get_jwks(secret="test-secret")
+    assert control_plane.get_jwks(secret="test-secret") is first
+    assert control_plane.get_jwks(secret="other-secret")["keys"][0]["k"] != first["keys"][0]["k"]
+
+
 def test_probe_endpoint_marks_client_errors_warn() -> None:
     response = MagicMock()
     response.status_code = 400
@@ -11,9 +11,8 @@ from raja.server import dependencies
 
 @pytest.fixture(autouse=True)
 def reset_caches() -> None:
-    """Reset all module-level caches before each test."""
-    dependencies._datazone_client = None
-    dependencies._jwt_secret_cache = None
+    """Reset all cached clients and secrets before each test."""
+    dependencies.clear_caches()
 
 
 def test_get_datazone_client_caches_result() -> None:
@@ -80,3 +79,27 @@ def test_get_jwt_secret_uses_version_when_configured() -> None:
             SecretId="arn:aws:secretsmanager:...",
             VersionId="version-2",
         )
+
+
+def test_get_jwt_secret_refetches_when_version_changes() -> None:
+    mock_client = MagicMock()
+    mock_client.get_secret_value.side_effect = [
+        {"SecretString": "test-jwt-secret-v1"},
+        {"SecretString": "test-jwt-secret-v2"},
+    ]
+    env = {"JWT_SECRET_ARN": "arn:aws:secretsmanager:...", "AWS_REGION": "us-east-1"}
+
+    with (
+        patch.dict("os.environ", {**env, "JWT_SECRET_VERSION": "version-1"}),
+        patch("boto3.client", return_value=mock_client),
+    ):
+        assert dependencies.get_jwt_secret() == "test-jwt-secret-v1"
+
+    with (
+        patch.dict("os.environ", {**env, "JWT_SECRET_VERSION": "version-2"}),
+        patch("boto3.client", return_value=mock_client),
+    ):
+        assert dependencies.get_jwt_secret() == "test-jwt-secret-v2"
+        assert dependencies.get_jwt_secret() == "test-jwt-secret-v2"
+
+    assert mock_client.get_secret_value.call_count == 2
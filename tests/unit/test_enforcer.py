@@ -1,12 +1,15 @@
 import time
 from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
 
 import jwt
 import pytest
 
 from raja.enforcer import (
+    ScopeMatcher,
     check_scopes,
     enforce,
+    enforce_many,
     enforce_package_grant,
     enforce_translation_grant,
     enforce_with_routing,
@@ -15,18 +18,28 @@ from raja.enforcer import (
 from raja.exceptions import ScopeValidationError
 from raja.models import AuthRequest, PackageAccessRequest, S3Location
 from raja.package_map import PackageMap
+from raja.scope import parse_scope
 from raja.token import (
     create_token,
     create_token_with_package_grant,
     create_token_with_package_map,
     decode_token,
+    validate_token,
+)
+
+# Requests are frozen models, so tests share these instead of re-validating per test.
+REQ_DOC1_READ = AuthRequest(resource_type="Document", resource_id="doc1", action="read")
+REQ_DOC1_WRITE = AuthRequest(resource_type="Document", resource_id="doc1", action="write")
+REQ_DOC2_READ = AuthRequest(resource_type="Document", resource_id="doc2", action="read")
+REQ_PACKAGE_FILE_GET = PackageAccessRequest(
+    bucket="bucket", key="data/file.csv", action="s3:GetObject"
 )
 
 
 def test_enforce_allows_matching_scope():
     secret = "secret"
     token_str = create_token("alice", ["Document:doc1:read"], ttl=60, secret=secret)
-    request = AuthRequest(resource_type="Document", resource_id="doc1", action="read")
+    request = REQ_DOC1_READ
     decision = enforce(token_str, request, secret)
     assert decision.allowed is True
     assert decision.matched_scope == "Document:doc1:read"
@@ -35,7 +48,7 @@ def test_enforce_allows_matching_scope():
 def test_enforce_denies_missing_scope():
     secret = "secret"
     token_str = create_token("alice", ["Document:doc1:read"], ttl=60, secret=secret)
-    request = AuthRequest(resource_type="Document", resource_id="doc1", action="write")
+    request = REQ_DOC1_WRITE
     decision = enforce(token_str, request, secret)
     assert decision.allowed is False
     assert decision.reason == "scope not granted"
@@ -43,7 +56,7 @@ def test_enforce_denies_missing_scope():
 
 def test_enforce_denies_invalid_token():
     secret = "secret"
-    request = AuthRequest(resource_type="Document", resource_id="doc1", action="read")
+    request = REQ_DOC1_READ
     decision = enforce("not-a-token", request, secret)
     assert decision.allowed is False
     assert decision.reason == "invalid token"
@@ -53,7 +66,7 @@ def test_enforce_denies_expired_token():
     """Test that expired tokens are denied with appropriate reason."""
     secret = "secret"
     token_str = create_token("alice", ["Document:doc1:read"], ttl=-1, secret=secret)
-    request = AuthRequest(resource_type="Document", resource_id="doc1", action="read")
+    request = REQ_DOC1_READ
     decision = enforce(token_str, request, secret)
     assert decision.allowed is False
     assert decision.reason == "token expired"
@@ -63,7 +76,7 @@ def test_enforce_denies_wrong_signature():
     """Test that tokens with wrong signature are denied."""
     secret = "secret"
     token_str = create_token("alice", ["Document:doc1:read"], ttl=60, secret="wrong-secret")
-    request = AuthRequest(resource_type="Document", resource_id="doc1", action="read")
+    request = REQ_DOC1_READ
     decision = enforce(token_str, request, secret)
     assert decision.allowed is False
     assert decision.reason == "invalid token"
@@ -71,7 +84,7 @@ def test_enforce_denies_wrong_signature():
 
 def test_check_scopes_validates_request():
     """Test that check_scopes properly validates the auth request."""
-    request = AuthRequest(resource_type="Document", resource_id="doc1", action="read")
+    request = REQ_DOC1_READ
     granted_scopes = ["Document:doc1:read"]
     result = check_scopes(request, granted_scopes)
     assert result is True
@@ -79,7 +92,7 @@ def test_check_scopes_validates_request():
 
 def test_check_scopes_denies_ungranted():
     """Test that check_scopes returns False for ungranted scopes."""
-    request = AuthRequest(resource_type="Document", resource_id="doc1", action="write")
+    request = REQ_DOC1_WRITE
     granted_scopes = ["Document:doc1:read"]
     result = check_scopes(request, granted_scopes)
     assert result is False
@@ -87,17 +100,42 @@ def test_check_scopes_denies_ungranted():
 
 def test_check_scopes_handles_invalid_granted_scope():
     """Test that check_scopes raises error for invalid granted scope strings."""
-    request = AuthRequest(resource_type="Document", resource_id="doc1", action="read")
+    request = REQ_DOC1_READ
     granted_scopes = ["invalid-scope-format"]
     with pytest.raises(ScopeValidationError):
         check_scopes(request, granted_scopes)
 
 
+def test_check_scopes_parses_grants_once_per_list():
+    granted_scopes = [f"Document:doc{i}:read" for i in range(1000)]
+    first = AuthRequest(resource_type="Document", resource_id="doc999", action="read")
+    second = AuthRequest(resource_type="Document", resource_id="doc1000", action="read")
+    assert check_scopes(first, granted_scopes) is True
+    with patch("raja.enforcer.parse_scope", wraps=parse_scope) as parse:
+        assert check_scopes(first, granted_scopes) is True
+        assert check_scopes(second, granted_scopes) is False
+    # Neither the indexed grants nor the already-validated request are re-parsed.
+    assert parse.call_count == 0
+
+
+def test_check_scopes_rejects_action_with_extra_colons():
+    request = AuthRequest(resource_type="Document", resource_id="doc1", action="s3:Get:Object")
+    with pytest.raises(ScopeValidationError):
+        check_scopes(request, ["Document:doc1:read"])
+
+
+def test_check_scopes_exact_grant_after_invalid_scope_still_raises():
+    request = REQ_DOC1_READ
+    granted_scopes = ["invalid-scope-format", "Document:doc1:read"]
+    with pytest.raises(ScopeValidationError):
+        check_scopes(request, granted_scopes)
+
+
 def test_enforce_handles_scope_validation_error():
     """Test that enforce handles scope validation errors in check_scopes."""
     secret = "secret"
     token_str = create_token("alice", ["invalid-scope"], ttl=60, secret=secret)
-    request = AuthRequest(resource_type="Document", resource_id="doc1", action="read")
+    request = REQ_DOC1_READ
 
     # This will cause a ScopeValidationError when check_scopes tries to parse the granted scope
     decision = enforce(token_str, request, secret)
@@ -107,11 +145,45 @@ def test_enforce_handles_scope_validation_error():
     assert "scope" in decision.reason.lower() or "internal error" in decision.reason.lower()
 
 
+def test_enforce_many_matches_enforce_in_input_order():
+    secret = "secret"
+    alice = create_token("alice", ["Document:doc1:read"], ttl=60, secret=secret)
+    expired = create_token("bob", ["Document:doc1:read"], ttl=-1, secret=secret)
+    read_doc1 = REQ_DOC1_READ
+    read_doc2 = REQ_DOC2_READ
+    pairs = [(alice, read_doc1), (expired, read_doc1), (alice, read_doc2), ("bad", read_doc1)]
+
+    decisions = enforce_many(pairs, secret)
+
+    assert decisions == [enforce(token_str, request, secret) for token_str, request in pairs]
+    assert [decision.reason for decision in decisions] == [
+        "scope matched",
+        "token expired",
+        "scope not granted",
+        "invalid token",
+    ]
+
+
+def test_enforce_many_validates_each_token_once():
+    secret = "secret"
+    token_str = create_token("alice", ["S3Object:bucket/data/:s3:GetObject"], ttl=60, secret=secret)
+    requests = [
+        AuthRequest(
+            resource_type="S3Object", resource_id=f"bucket/data/{i}.csv", action="s3:GetObject"
+        )
+        for i in range(20)
+    ]
+    with patch("raja.enforcer.validate_token", wraps=validate_token) as validate:
+        decisions = enforce_many([(token_str, request) for request in requests], secret)
+    assert all(decision.allowed for decision in decisions)
+    assert validate.call_count == 1
+
+
 def test_enforce_logs_allowed_authorization():
     """Test that enforce properly logs successful authorization."""
     secret = "secret"
     token_str = create_token("alice", ["Document:doc1:read"], ttl=60, secret=secret)
-    request = AuthRequest(resource_type="Document", resource_id="doc1", action="read")
+    request = REQ_DOC1_READ
 
     decision = enforce(token_str, request, secret)
 
@@ -124,7 +196,7 @@ def test_enforce_logs_denied_authorization():
     """Test that enforce properly logs denied authorization."""
     secret = "secret"
     token_str = create_token("alice", ["Document:doc1:read"], ttl=60, secret=secret)
-    request = AuthRequest(resource_type="Document", resource_id="doc2", action="read")
+    request = REQ_DOC2_READ
 
     decision = enforce(token_str, request, secret)
 
@@ -255,7 +327,7 @@ def test_enforce_package_grant_allows_member() -> None:
     token_str = create_token_with_package_grant(
         "alice", quilt_uri=quilt_uri, mode="read", ttl=60, secret=secret
     )
-    request = PackageAccessRequest(bucket="bucket", key="data/file.csv", action="s3:GetObject")
+    request = REQ_PACKAGE_FILE_GET
 
     def checker(uri: str, bucket: str, key: str) -> bool:
         return uri == quilt_uri and bucket == "bucket" and key == "data/file.csv"
@@ -265,6 +337,22 @@ def test_enforce_package_grant_allows_member() -> None:
     assert decision.matched_scope == quilt_uri
 
 
+def test_enforce_package_grant_reuses_verified_payload() -> None:
+    secret = "secret"
+    quilt_uri = "quilt+s3://registry#package=my/pkg@abc123def456"
+    token_str = create_token_with_package_grant(
+        "alice", quilt_uri=quilt_uri, mode="read", ttl=60, secret=secret
+    )
+    request = REQ_PACKAGE_FILE_GET
+
+    with patch("raja.token.jwt.decode", wraps=jwt.decode) as decode:
+        for _ in range(3):
+            decision = enforce_package_grant(token_str, request, secret, lambda *_: True)
+            assert decision.allowed is True
+
+    assert decode.call_count == 1
+
+
 def test_enforce_package_grant_denies_non_member() -> None:
     secret = "secret"
     quilt_uri = "quilt+s3://registry#package=my/pkg@abc123def456"
@@ -303,7 +391,7 @@ def test_enforce_package_grant_denies_on_checker_error() -> None:
     token_str = create_token_with_package_grant(
         "alice", quilt_uri=quilt_uri, mode="read", ttl=60, secret=secret
     )
-    request = PackageAccessRequest(bucket="bucket", key="data/file.csv", action="s3:GetObject")
+    request = REQ_PACKAGE_FILE_GET
 
     def checker(uri: str, bucket: str, key: str) -> bool:
         raise RuntimeError("boom")
@@ -420,18 +508,35 @@ def test_enforce_translation_grant_denies_on_resolver_error() -> None:
 def test_enforce_with_routing_uses_scopes_token() -> None:
     secret = "secret"
     token_str = create_token("alice", ["Document:doc1:read"], ttl=60, secret=secret)
-    request = AuthRequest(resource_type="Document", resource_id="doc1", action="read")
+    request = REQ_DOC1_READ
     decision = enforce_with_routing(token_str, request, secret)
     assert decision.allowed is True
 
 
+def test_enforce_with_routing_verifies_signature_once() -> None:
+    secret = "secret"
+    token_str = create_token("alice", ["Document:doc1:read"], ttl=60, secret=secret)
+    request = REQ_DOC1_READ
+    with patch("raja.token.jwt.decode", wraps=jwt.decode) as decode:
+        assert enforce_with_routing(token_str, request, secret).allowed is True
+    assert decode.call_count == 1
+
+
+def test_enforce_with_routing_rejects_wrong_signature_before_routing() -> None:
+    token_str = create_token("alice", ["Document:doc1:read"], ttl=60, secret="wrong-secret")
+    request = REQ_PACKAGE_FILE_GET
+    decision = enforce_with_routing(token_str, request, "secret")
+    assert decision.allowed is False
+    assert decision.reason == "invalid token"
+
+
 def test_enforce_with_routing_uses_package_grant() -> None:
     secret = "secret"
     quilt_uri = "quilt+s3://registry#package=my/pkg@abc123def456"
     token_str = create_token_with_package_grant(
         "alice", quilt_uri=quilt_uri, mode="read", ttl=60, secret=secret
     )
-    request = PackageAccessRequest(bucket="bucket", key="data/file.csv", action="s3:GetObject")
+    request = REQ_PACKAGE_FILE_GET
 
     def checker(uri: str, bucket: str, key: str) -> bool:
         return uri == quilt_uri and bucket == "bucket" and key == "data/file.csv"
@@ -480,7 +585,7 @@ def test_enforce_with_routing_rejects_mixed_token() -> None:
         "scopes": ["Document:doc1:read"],
     }
     mixed_token = jwt.encode(mixed_payload, "secret", algorithm="HS256")
-    request = PackageAccessRequest(bucket="bucket", key="data/file.csv", action="s3:GetObject")
+    request = REQ_PACKAGE_FILE_GET
     decision = enforce_with_routing(mixed_token, request, "secret")
     assert decision.allowed is False
     assert decision.reason == "mixed token types are not supported"
@@ -492,7 +597,7 @@ def test_enforce_with_routing_requires_handlers() -> None:
     token_str = create_token_with_package_grant(
         "alice", quilt_uri=quilt_uri, mode="read", ttl=60, secret=secret
     )
-    request = PackageAccessRequest(bucket="bucket", key="data/file.csv", action="s3:GetObject")
+    request = REQ_PACKAGE_FILE_GET
     decision = enforce_with_routing(token_str, request, secret)
     assert decision.allowed is False
     assert decision.reason == "package membership check failed"
@@ -504,21 +609,54 @@ def test_enforce_with_routing_rejects_invalid_request() -> None:
     token_str = create_token_with_package_grant(
         "alice", quilt_uri=quilt_uri, mode="read", ttl=60, secret=secret
     )
-    request = AuthRequest(resource_type="Document", resource_id="doc1", action="read")
+    request = REQ_DOC1_READ
     decision = enforce_with_routing(token_str, request, secret)
     assert decision.allowed is False
     assert decision.reason == "invalid request for package token"
 
 
 def test_check_scopes_rejects_missing_action() -> None:
-    request = AuthRequest(resource_type="Document", resource_id="doc1", action="read")
+    request = REQ_DOC1_READ
     with pytest.raises(ScopeValidationError):
         check_scopes(request, ["Document:doc1"])
 
 
+@pytest.mark.parametrize(
+    ("resource_type", "resource_id", "action", "expected"),
+    [
+        ("S3Object", "bucket/uploads/a/b.txt", "s3:GetObject", True),
+        ("S3Object", "bucket/uploads/a/b.txt", "s3:HeadObject", True),
+        ("S3Object", "bucket/uploads/a/b.txt", "s3:PutObject", False),
+        ("S3Object", "bucket/uploadsx/b.txt", "s3:GetObject", False),
+        ("S3Object", "bucket/exact.txt", "s3:UploadPart", True),
+        ("S3Object", "bucket/exact.txt.bak", "s3:PutObject", False),
+        ("S3Object", "other/uploads/a.txt", "s3:GetObject", False),
+        ("S3Bucket", "bucket", "s3:ListBucket", True),
+        ("Package", "my/pkg@abc123", "quilt:ReadPackage", True),
+        ("Package", "other/pkg@abc123", "quilt:ReadPackage", False),
+    ],
+)
+def test_scope_matcher_agrees_with_prefix_match(
+    resource_type: str, resource_id: str, action: str, expected: bool
+) -> None:
+    granted_scopes = [
+        "S3Object:bucket/uploads/:s3:GetObject",
+        "S3Object:bucket/exact.txt:s3:PutObject",
+        "S3Bucket:bucket:s3:ListBucket",
+        "Package:my/*@abc123:quilt:ReadPackage",
+    ]
+    request = AuthRequest(resource_type=resource_type, resource_id=resource_id, action=action)
+    requested_scope = f"{resource_type}:{resource_id}:{action}"
+    matcher = ScopeMatcher(granted_scopes)
+
+    assert check_scopes(request, matcher) is expected
+    assert check_scopes(request, granted_scopes) is expected
+    assert expected is any(is_prefix_match(scope, requested_scope) for scope in granted_scopes)
+
+
 @pytest.mark.slow
 def test_check_scopes_large_token_performance() -> None:
-    request = AuthRequest(resource_type="Document", resource_id="doc1", action="read")
+    request = REQ_DOC1_READ
     granted_scopes = [f"Document:doc{i}:read" for i in range(2000)]
     granted_scopes.append("Document:doc1:read")
     start = time.perf_counter()
@@ -529,11 +667,12 @@ def test_check_scopes_large_token_performance() -> None:
 
 @pytest.mark.slow
 def test_check_scopes_concurrent_requests() -> None:
-    request = AuthRequest(resource_type="Document", resource_id="doc1", action="read")
+    request = REQ_DOC1_READ
     granted_scopes = ["Document:doc1:read"]
+    matcher = ScopeMatcher(granted_scopes)
 
     def _run() -> bool:
-        return check_scopes(request, granted_scopes)
+        return check_scopes(request, matcher)
 
     with ThreadPoolExecutor(max_workers=8) as executor:
         results = list(executor.map(lambda _: _run(), range(50)))
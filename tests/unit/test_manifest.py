@@ -2,6 +2,9 @@ from __future__ import annotations
 
 from types import SimpleNamespace
 
+import pytest
+from pydantic import ValidationError
+
 from raja.manifest import (
     package_membership_checker,
     resolve_package_manifest,
@@ -22,9 +25,12 @@ class _FakePackage:
 
 
 class _FakeQuilt3:
+    browse_calls = 0
+
     class Package:
         @staticmethod
         def browse(name: str, registry: str, top_hash: str) -> _FakePackage:
+            _FakeQuilt3.browse_calls += 1
             assert name == "my/pkg"
             assert registry == "s3://registry"
             assert top_hash == "abc123def456"
@@ -62,3 +68,36 @@ def test_package_membership_checker(monkeypatch) -> None:
     quilt_uri = "quilt+s3://registry#package=my/pkg@abc123def456"
     assert package_membership_checker(quilt_uri, "bucket-a", "data/file.csv") is True
     assert package_membership_checker(quilt_uri, "bucket-a", "missing.csv") is False
+    assert package_membership_checker(quilt_uri, "bucket-a", "data/other.csv") is False
+
+
+def test_resolve_package_map_browses_each_package_once(monkeypatch) -> None:
+    _patch_quilt3(monkeypatch)
+    monkeypatch.setattr(_FakeQuilt3, "browse_calls", 0)
+    resolve_package_map("quilt+s3://registry#package=my/pkg@abc123def456")
+    resolve_package_map("Quilt+S3://registry/#package=my/pkg@abc123def456")
+    resolve_package_manifest("quilt+s3://registry#package=my/pkg@abc123def456")
+    assert _FakeQuilt3.browse_calls == 1
+
+
+def test_resolve_package_map_ignores_path_when_caching(monkeypatch) -> None:
+    _patch_quilt3(monkeypatch)
+    monkeypatch.setattr(_FakeQuilt3, "browse_calls", 0)
+    first = resolve_package_map("quilt+s3://registry#package=my/pkg@abc123def456&path=logical/a")
+    second = resolve_package_map("quilt+s3://registry#package=my/pkg@abc123def456&path=logical/b")
+    assert first is second
+    assert _FakeQuilt3.browse_calls == 1
+
+
+def test_resolved_package_map_cannot_be_changed_by_callers(monkeypatch) -> None:
+    _patch_quilt3(monkeypatch)
+    quilt_uri = "quilt+s3://registry#package=my/pkg@abc123def456"
+    targets = resolve_package_map(quilt_uri).translate("logical/file.csv")
+    targets.append(S3Location(bucket="bucket-x", key="data/extra.csv"))
+    with pytest.raises(ValidationError):
+        targets[0].bucket = "bucket-x"
+
+    assert resolve_package_map(quilt_uri).translate("logical/file.csv") == [
+        S3Location(bucket="bucket-a", key="data/file.csv")
+    ]
+    assert not package_membership_checker(quilt_uri, "bucket-x", "data/extra.csv")
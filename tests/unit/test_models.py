@@ -1,4 +1,5 @@
 import pytest
+from pydantic import ValidationError
 
 from raja.models import AuthRequest, Scope, Token
 
@@ -20,6 +21,12 @@ def test_auth_request_validation():
     assert request.resource_type == "S3Object"
 
 
+def test_auth_request_is_frozen():
+    request = AuthRequest(resource_type="Document", resource_id="doc1", action="read")
+    with pytest.raises(ValidationError):
+        request.resource_id = "doc2"
+
+
 def test_token_requires_subject():
     with pytest.raises(ValueError):
         Token(
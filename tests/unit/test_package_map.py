@@ -20,3 +20,34 @@ def test_package_map_translate_unknown_key_returns_empty() -> None:
     resolved = package_map.translate("logical/unknown.txt")
 
     assert resolved == []
+
+
+def test_package_map_contains_physical_locations() -> None:
+    package_map = PackageMap(
+        entries={
+            "logical/a.txt": [S3Location(bucket="physical-bucket", key="data/a.txt")],
+            "logical/b.txt": [
+                S3Location(bucket="physical-bucket", key="data/b.txt"),
+                S3Location(bucket="archive-bucket", key="data/b.txt"),
+            ],
+        }
+    )
+
+    assert package_map.contains("archive-bucket", "data/b.txt")
+    assert package_map.contains("physical-bucket", "data/a.txt")
+    assert not package_map.contains("archive-bucket", "data/a.txt")
+    assert not package_map.contains("physical-bucket", "logical/a.txt")
+
+
+def test_package_map_contains_tracks_updated_entries() -> None:
+    package_map = PackageMap(
+        entries={"logical/a.txt": [S3Location(bucket="physical-bucket", key="data/a.txt")]}
+    )
+    assert package_map.contains("physical-bucket", "data/a.txt")
+
+    updated = package_map.model_copy(
+        update={"entries": {"logical/b.txt": [S3Location(bucket="other-bucket", key="data/b.txt")]}}
+    )
+
+    assert not updated.contains("physical-bucket", "data/a.txt")
+    assert updated.contains("other-bucket", "data/b.txt")
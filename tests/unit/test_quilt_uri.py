@@ -21,6 +21,16 @@ def test_parse_quilt_uri_with_path() -> None:
     assert parsed.path == "data/file.csv"
 
 
+def test_parse_quilt_uri_reuses_parsed_result() -> None:
+    uri = "quilt+s3://registry#package=my/pkg@abc123def456"
+    assert parse_quilt_uri(uri) is parse_quilt_uri(uri)
+
+
+def test_parse_quilt_uri_rejects_non_string() -> None:
+    with pytest.raises(ValueError):
+        parse_quilt_uri(["quilt+s3://registry#package=my/pkg@abc123def456"])  # type: ignore[arg-type]
+
+
 def test_normalize_quilt_uri() -> None:
     uri = "Quilt+S3://registry/#package=my/pkg@abc123def456&path=data\\file.csv"
     normalized = normalize_quilt_uri(uri)
@@ -28,6 +38,14 @@ def test_normalize_quilt_uri() -> None:
     assert normalized == "quilt+s3://registry#package=my/pkg@abc123def456&path=data/file.csv"
 
 
+def test_normalize_quilt_uri_is_idempotent() -> None:
+    uri = "Quilt+S3://registry/#package=my/pkg@abc123def456&path=data\\file.csv"
+    normalized = normalize_quilt_uri(uri)
+
+    assert normalize_quilt_uri(uri) == normalized
+    assert normalize_quilt_uri(normalized) == normalized
+
+
 @pytest.mark.parametrize(
     "uri",
     [
@@ -12,6 +12,10 @@ def test_parse_scope_valid():
     assert scope.action == "read"
 
 
+def test_parse_scope_reuses_parsed_scope():
+    assert parse_scope("Document:doc123:read") is parse_scope("Document:doc123:read")
+
+
 def test_parse_scope_invalid():
     with pytest.raises(ScopeParseError):
         parse_scope("Document-doc123-read")
@@ -29,6 +33,15 @@ def test_parse_scope_empty_string():
         parse_scope("")
 
 
+@pytest.mark.parametrize(
+    "scope_str",
+    [":doc123:read", "Document::read", "Document:doc123:", "Document:doc123:re\nad"],
+)
+def test_parse_scope_rejects_malformed_components(scope_str: str) -> None:
+    with pytest.raises(ScopeParseError):
+        parse_scope(scope_str)
+
+
 def test_parse_scope_with_colons_in_action():
     """Test that colons in action part are preserved."""
     scope = parse_scope("Document:doc123:read:write")
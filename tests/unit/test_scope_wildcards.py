@@ -1,8 +1,12 @@
 """Tests for wildcard pattern matching and scope expansion (Phase 4)."""
 
+import re
+from unittest.mock import patch
+
 import pytest
 
 from raja.scope import (
+    _compile_scope_pattern,
     expand_wildcard_scope,
     filter_scopes_by_pattern,
     matches_pattern,
@@ -10,6 +14,8 @@ from raja.scope import (
     scope_matches,
 )
 
+_CANNOT_EXPAND_TYPE = re.compile("cannot expand resource type wildcard")
+
 
 def test_matches_pattern_exact():
     """Test exact pattern matching."""
@@ -45,6 +51,21 @@ def test_matches_pattern_middle():
     assert not matches_pattern("s3:GetObject:v2", "s3:*:v1")
 
 
+def test_matches_pattern_wildcard_does_not_span_newlines():
+    """Test that '*' inside a pattern stops at newlines, while a lone '*' matches all."""
+    assert matches_pattern("s3:Get\nObject", "*")
+    assert not matches_pattern("s3:Get\nObject", "s3:*")
+    assert not matches_pattern("doc\nx:read", "*:read")
+    assert not matches_pattern("s3:Get\nObject:v1", "s3:*:v1")
+
+
+def test_matches_pattern_many_wildcards_does_not_backtrack():
+    """Test that patterns with many wildcards match in linear time."""
+    pattern = "*a" * 20 + "*b*"
+    assert not matches_pattern("a" * 5000, pattern)
+    assert matches_pattern("a" * 5000 + "b", pattern)
+
+
 def test_scope_matches_exact():
     """Test exact scope matching."""
     requested = parse_scope("Document:doc123:read")
@@ -124,7 +145,7 @@ def test_expand_wildcard_scope_resource_type():
 
 def test_expand_wildcard_scope_resource_type_no_context():
     """Test expanding resource type wildcard without context raises error."""
-    with pytest.raises(ValueError, match="cannot expand resource type wildcard"):
+    with pytest.raises(ValueError, match=_CANNOT_EXPAND_TYPE):
         expand_wildcard_scope("*:doc123:read")
 
 
@@ -214,3 +235,20 @@ def test_filter_scopes_wildcard_bucket():
     assert "S3Object:bucket-a/key1:s3:GetObject" in result
     assert "S3Object:bucket-a/key2:s3:PutObject" in result
     assert "S3Object:bucket-b/key1:s3:GetObject" not in result
+
+
+def test_filter_scopes_compiles_each_pattern_once():
+    """Test that each pattern is compiled once across both filter passes."""
+    scopes = [f"S3Bucket:bucket-{i}:s3:GetObject" for i in range(50)]
+    include_patterns = ["S3Bucket:*:s3:*", "Document:*:*"]
+    exclude_patterns = ["*:bucket-1*:*"]
+    with patch(
+        "raja.scope._compile_scope_pattern", wraps=_compile_scope_pattern
+    ) as compile_pattern:
+        result = filter_scopes_by_pattern(scopes, include_patterns, exclude_patterns)
+    assert len(result) == 39
+    # "Document:*:*" is never reached: the first include pattern matches every scope.
+    assert [call.args[0] for call in compile_pattern.call_args_list] == [
+        "S3Bucket:*:s3:*",
+        "*:bucket-1*:*",
+    ]
@@ -1,14 +1,16 @@
-import importlib
 import re
 from unittest.mock import patch
 
 import pytest
 from fastapi.testclient import TestClient
 
-server_app = importlib.import_module("raja.server.app")
-dependencies = importlib.import_module("raja.server.dependencies")
+from raja.server import app, dependencies
 
-app = server_app.app
+
+@pytest.fixture(scope="module")
+def client() -> TestClient:
+    """One client for the module; the app is stateless between requests."""
+    return TestClient(app)
 
 
 @pytest.fixture(autouse=True)
@@ -18,15 +20,13 @@ def bypass_admin_auth() -> None:
     app.dependency_overrides.clear()
 
 
-def test_admin_home_returns_html():
-    client = TestClient(app)
+def test_admin_home_returns_html(client: TestClient):
     response = client.get("/")
     assert response.status_code == 200
     assert "RAJA Admin" in response.text
 
 
-def test_health_endpoint():
-    client = TestClient(app)
+def test_health_endpoint(client: TestClient):
     response = client.get("/health")
     assert response.status_code == 200
     payload = response.json()
@@ -34,8 +34,7 @@ def test_health_endpoint():
     assert "dependencies" in payload
 
 
-def test_health_exposes_default_principal_when_configured() -> None:
-    client = TestClient(app)
+def test_health_exposes_default_principal_when_configured(client: TestClient) -> None:
     with patch.dict(
         "os.environ",
         {"RAJA_DEFAULT_PRINCIPAL": "arn:aws:iam::123456789012:user/demo-alpha"},
@@ -47,8 +46,7 @@ def test_health_exposes_default_principal_when_configured() -> None:
     assert payload["config"]["default_principal"] == "arn:aws:iam::123456789012:user/demo-alpha"
 
 
-def test_create_policy_returns_gone() -> None:
-    client = TestClient(app)
+def test_create_policy_returns_gone(client: TestClient) -> None:
     response = client.post(
         "/policies",
         json={"statement": "permit(principal, action, resource);"},
@@ -56,7 +54,7 @@ def test_create_policy_returns_gone() -> None:
     assert response.status_code == 410
 
 
-def test_get_policy_by_id() -> None:
+def test_get_policy_by_id(client: TestClient) -> None:
     from unittest.mock import MagicMock
 
     mock_datazone = MagicMock()
@@ -75,7 +73,6 @@ def test_get_policy_by_id() -> None:
             service = factory.return_value
             service._config.asset_type_name = "QuiltPackage"
             service._search_listings.return_value = response_payload
-            client = TestClient(app)
             response = client.get("/policies/l-123")
         assert response.status_code == 200
         payload = response.json()
@@ -85,21 +82,19 @@ def test_get_policy_by_id() -> None:
         app.dependency_overrides.clear()
 
 
-def test_update_policy_returns_gone() -> None:
-    client = TestClient(app)
+def test_update_policy_returns_gone(client: TestClient) -> None:
     response = client.put(
         "/policies/p-123", json={"statement": "permit(principal, action, resource);"}
     )
     assert response.status_code == 410
 
 
-def test_delete_policy_returns_gone() -> None:
-    client = TestClient(app)
+def test_delete_policy_returns_gone(client: TestClient) -> None:
     response = client.delete("/policies/p-123")
     assert response.status_code == 410
 
 
-def test_list_policies_returns_datazone_listings() -> None:
+def test_list_policies_returns_datazone_listings(client: TestClient) -> None:
     from unittest.mock import MagicMock
 
     mock_datazone = MagicMock()
@@ -118,7 +113,6 @@ def test_list_policies_returns_datazone_listings() -> None:
             service = factory.return_value
             service._config.asset_type_name = "QuiltPackage"
             service._search_listings.return_value = response_payload
-            client = TestClient(app)
             response = client.get("/policies")
         assert response.status_code == 200
         payload = response.json()
@@ -127,9 +121,8 @@ def test_list_policies_returns_datazone_listings() -> None:
         app.dependency_overrides.clear()
 
 
-def test_admin_html_static_refs_are_relative():
+def test_admin_html_static_refs_are_relative(client: TestClient):
     """admin.html must use relative paths for static assets."""
-    client = TestClient(app)
     response = client.get("/")
     assert response.status_code == 200
     html = response.text
@@ -139,16 +132,14 @@ def test_admin_html_static_refs_are_relative():
     )
 
 
-def test_static_assets_are_served():
+def test_static_assets_are_served(client: TestClient):
     """Static assets must return 200 so the admin UI can load."""
-    client = TestClient(app)
     for path in ("/static/admin.css", "/static/admin.js"):
         response = client.get(path)
         assert response.status_code == 200, f"{path} returned {response.status_code}"
 
 
-def test_admin_js_has_no_hardcoded_demo_principal() -> None:
-    client = TestClient(app)
+def test_admin_js_has_no_hardcoded_demo_principal(client: TestClient) -> None:
     response = client.get("/static/admin.js")
     assert response.status_code == 200
     assert '"User::demo"' not in response.text
@@ -1,4 +1,7 @@
+import hmac
 import time
+from typing import Any
+from unittest.mock import patch
 
 import jwt
 import pytest
@@ -15,22 +18,88 @@ from raja.token import (
     validate_package_map_token,
     validate_package_token,
     validate_token,
+    verify_token,
 )
 
+_LARGE_SCOPES = tuple(f"Document:doc{i}:read" for i in range(1000))
 
-def test_create_and_validate_token():
-    secret = "supersecret"
-    token_str = create_token("alice", ["Document:doc1:read"], ttl=60, secret=secret)
-    token = validate_token(token_str, secret)
+
+# Tokens that are only read, never tampered with or aged, are signed once per module.
+@pytest.fixture(scope="module")
+def basic_token() -> str:
+    return create_token("alice", ["Document:doc1:read"], ttl=60, secret="secret")
+
+
+@pytest.fixture(scope="module")
+def grants_token_full() -> str:
+    return create_token_with_grants(
+        "alice",
+        ["s3:GetObject/bucket/key.txt"],
+        ttl=60,
+        secret="secret",
+        issuer="https://issuer.test",
+        audience=["raja-s3-proxy"],
+    )
+
+
+@pytest.fixture(scope="module")
+def grants_token_minimal() -> str:
+    return create_token_with_grants("alice", ["grant1", "grant2"], ttl=60, secret="secret")
+
+
+def test_create_and_validate_token(basic_token: str) -> None:
+    token = validate_token(basic_token, "secret")
     assert token.subject == "alice"
     assert "Document:doc1:read" in token.scopes
+    # The same token decodes without validation.
+    assert decode_token(basic_token)["sub"] == "alice"
 
 
-def test_decode_token_without_validation():
-    secret = "supersecret"
-    token_str = create_token("alice", ["Document:doc1:read"], ttl=60, secret=secret)
-    payload = decode_token(token_str)
-    assert payload["sub"] == "alice"
+def test_validate_token_reuses_verified_payload(basic_token: str) -> None:
+    with patch("raja.token.jwt.decode", wraps=jwt.decode) as decode:
+        first = validate_token(basic_token, "secret")
+        second = validate_token(basic_token, "secret")
+    assert first == second
+    assert decode.call_count == 1
+
+
+def test_verify_token_payload_mutation_does_not_leak_into_cache(basic_token: str) -> None:
+    payload = verify_token(basic_token, "secret")
+    payload["scopes"].append("Document:doc2:write")
+    payload.pop("exp")
+    payload["sub"] = "mallory"
+    token = validate_token(basic_token, "secret")
+    assert token.subject == "alice"
+    assert token.scopes == ["Document:doc1:read"]
+    assert verify_token(basic_token, "secret")["exp"] == token.expires_at
+
+
+def test_verify_token_copies_nested_claims() -> None:
+    token_str = jwt.encode(
+        {"sub": "alice", "scopes": [], "ctx": {"roles": ["reader"]}, "exp": int(time.time()) + 60},
+        "secret",
+        algorithm="HS256",
+    )
+    verify_token(token_str, "secret")["ctx"]["roles"].append("admin")
+    assert verify_token(token_str, "secret")["ctx"] == {"roles": ["reader"]}
+
+
+def test_validate_token_reverifies_after_expiry():
+    token_str = create_token("alice", ["Document:doc1:read"], ttl=60, secret="secret")
+    validate_token(token_str, "secret")
+    with (
+        patch("raja.token.time.time", return_value=time.time() + 120),
+        patch("raja.token.jwt.decode", wraps=jwt.decode) as decode,
+    ):
+        validate_token(token_str, "secret")
+    assert decode.call_count == 1
+
+
+def test_validate_token_cache_is_keyed_by_secret():
+    token_str = create_token("alice", ["Document:doc1:read"], ttl=60, secret="secret-a")
+    validate_token(token_str, "secret-a")
+    with pytest.raises(TokenInvalidError):
+        validate_token(token_str, "secret-b")
 
 
 def test_validate_token_rejects_invalid_signature():
@@ -39,74 +108,80 @@ def test_validate_token_rejects_invalid_signature():
         validate_token(token_str, "secret-b")
 
 
+def _flip_signature_char(token_str: str, index: int) -> str:
+    header, payload, signature = token_str.split(".")
+    chars = list(signature)
+    chars[index] = "A" if chars[index] != "A" else "B"
+    return ".".join((header, payload, "".join(chars)))
+
+
+@pytest.mark.parametrize("index", [0, -2], ids=["first-char", "last-full-char"])
+def test_validate_token_compares_signatures_in_constant_time(index: int) -> None:
+    """Signature checks go through hmac.compare_digest wherever the mismatch is."""
+    token_str = create_token("alice", ["Document:doc1:read"], ttl=60, secret="secret")
+    tampered = _flip_signature_char(token_str, index)
+    with (
+        patch("jwt.algorithms.hmac.compare_digest", wraps=hmac.compare_digest) as compare,
+        pytest.raises(TokenInvalidError),
+    ):
+        validate_token(tampered, "secret")
+    assert compare.call_count == 1
+
+
 def test_validate_token_rejects_expired():
     token_str = create_token("alice", ["Document:doc1:read"], ttl=-1, secret="secret")
     with pytest.raises(TokenExpiredError):
         validate_token(token_str, "secret")
 
 
-def test_is_expired():
+@pytest.fixture
+def frozen_now(monkeypatch: pytest.MonkeyPatch) -> int:
+    """Pin raja.token's clock so expiry checks do not race the wall clock."""
+    now = 1_700_000_000
+    monkeypatch.setattr("raja.token.time.time", lambda: float(now))
+    return now
+
+
+def test_is_expired(frozen_now: int) -> None:
     token = Token(
         subject="alice",
         scopes=["Document:doc1:read"],
-        issued_at=int(time.time()) - 10,
-        expires_at=int(time.time()) - 1,
+        issued_at=frozen_now - 10,
+        expires_at=frozen_now - 1,
     )
     assert is_expired(token) is True
 
 
-def test_is_not_expired():
+def test_is_not_expired(frozen_now: int) -> None:
     """Test that is_expired returns False for valid tokens."""
     token = Token(
         subject="alice",
         scopes=["Document:doc1:read"],
-        issued_at=int(time.time()),
-        expires_at=int(time.time()) + 3600,
+        issued_at=frozen_now,
+        expires_at=frozen_now + 3600,
     )
     assert is_expired(token) is False
 
 
-def test_create_token_with_issuer():
-    """Test that create_token includes issuer claim when provided."""
-    token_str = create_token(
-        "alice", ["Document:doc1:read"], ttl=60, secret="secret", issuer="https://issuer.test"
-    )
-    payload = decode_token(token_str)
-    assert payload["iss"] == "https://issuer.test"
-
-
-def test_create_token_with_audience_string():
-    """Test that create_token includes audience claim as string."""
-    token_str = create_token(
-        "alice", ["Document:doc1:read"], ttl=60, secret="secret", audience="api-service"
-    )
-    payload = decode_token(token_str)
-    assert payload["aud"] == "api-service"
-
-
-def test_create_token_with_audience_list():
-    """Test that create_token includes audience claim as list."""
-    token_str = create_token(
-        "alice",
-        ["Document:doc1:read"],
-        ttl=60,
-        secret="secret",
-        audience=["api-service", "web-app"],
-    )
+@pytest.mark.parametrize(
+    ("claims", "claim", "expected"),
+    [
+        ({"issuer": "https://issuer.test"}, "iss", "https://issuer.test"),
+        ({"audience": "api-service"}, "aud", "api-service"),
+        ({"audience": ["api-service", "web-app"]}, "aud", ["api-service", "web-app"]),
+    ],
+)
+def test_create_token_includes_optional_claims(
+    claims: dict[str, Any], claim: str, expected: str | list[str]
+) -> None:
+    """Test that create_token includes issuer and audience claims when provided."""
+    token_str = create_token("alice", ["Document:doc1:read"], ttl=60, secret="secret", **claims)
     payload = decode_token(token_str)
-    assert payload["aud"] == ["api-service", "web-app"]
+    assert payload[claim] == expected
 
 
-def test_create_token_with_grants_includes_claims():
-    token_str = create_token_with_grants(
-        "alice",
-        ["s3:GetObject/bucket/key.txt"],
-        ttl=60,
-        secret="secret",
-        issuer="https://issuer.test",
-        audience=["raja-s3-proxy"],
-    )
-    payload = decode_token(token_str)
+def test_create_token_with_grants_includes_claims(grants_token_full: str) -> None:
+    payload = decode_token(grants_token_full)
     assert payload["sub"] == "alice"
     assert payload["grants"] == ["s3:GetObject/bucket/key.txt"]
     assert payload["iss"] == "https://issuer.test"
@@ -125,6 +200,16 @@ def test_decode_token_empty_string():
         decode_token("")
 
 
+@pytest.mark.parametrize("token_str", ["", "a.b", "a.b.c.d", "a." * 1000 + "b"])
+def test_decode_token_rejects_wrong_segment_count_before_decoding(token_str: str) -> None:
+    with (
+        patch("raja.token.jwt.decode", wraps=jwt.decode) as decode,
+        pytest.raises(TokenInvalidError, match="three dot-separated segments"),
+    ):
+        decode_token(token_str)
+    decode.assert_not_called()
+
+
 def test_validate_token_malformed():
     """Test that validate_token raises error for malformed token."""
     with pytest.raises(TokenInvalidError):
@@ -147,15 +232,9 @@ def test_create_token_with_grants_with_string_audience():
     assert "iss" not in payload  # No issuer provided
 
 
-def test_create_token_with_grants_without_issuer_audience():
+def test_create_token_with_grants_without_issuer_audience(grants_token_minimal: str) -> None:
     """Test that create_token_with_grants works without issuer/audience."""
-    token_str = create_token_with_grants(
-        "alice",
-        ["grant1", "grant2"],
-        ttl=60,
-        secret="secret",
-    )
-    payload = decode_token(token_str)
+    payload = decode_token(grants_token_minimal)
     assert payload["grants"] == ["grant1", "grant2"]
     assert "iss" not in payload
     assert "aud" not in payload
@@ -325,31 +404,23 @@ def test_validate_package_token_rejects_invalid_mode():
         validate_package_token(token_str, "secret")
 
 
-def test_validate_token_rejects_missing_subject():
-    """Test that validate_token rejects tokens missing a subject."""
-    token_str = jwt.encode({"scopes": ["Document:doc1:read"]}, "secret", algorithm="HS256")
-    with pytest.raises(TokenValidationError):
-        validate_token(token_str, "secret")
-
-
-def test_validate_token_rejects_null_scopes():
-    """Test that validate_token rejects tokens with null scopes."""
-    token_str = jwt.encode({"sub": "alice", "scopes": None}, "secret", algorithm="HS256")
-    with pytest.raises(TokenValidationError):
-        validate_token(token_str, "secret")
-
-
-def test_validate_token_rejects_non_list_scopes():
-    """Test that validate_token rejects tokens with non-list scopes."""
-    token_str = jwt.encode(
-        {"sub": "alice", "scopes": "Document:doc1:read"}, "secret", algorithm="HS256"
-    )
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"scopes": ["Document:doc1:read"]},
+        {"sub": "alice", "scopes": None},
+        {"sub": "alice", "scopes": "Document:doc1:read"},
+    ],
+    ids=["missing-subject", "null-scopes", "non-list-scopes"],
+)
+def test_validate_token_rejects_invalid_claims(payload: dict[str, Any]) -> None:
+    """Test that validate_token rejects tokens with missing or malformed claims."""
+    token_str = jwt.encode(payload, "secret", algorithm="HS256")
     with pytest.raises(TokenValidationError):
         validate_token(token_str, "secret")
 
 
 def test_validate_token_large_scopes():
-    scopes = [f"Document:doc{i}:read" for i in range(1000)]
-    token_str = create_token("alice", scopes, ttl=60, secret="secret")
+    token_str = create_token("alice", list(_LARGE_SCOPES), ttl=60, secret="secret")
     token = validate_token(token_str, "secret")
-    assert len(token.scopes) == 1000
+    assert len(token.scopes) == len(_LARGE_SCOPES)